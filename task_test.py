@@ -1,8 +1,11 @@
 import tasks, userdata
 from langchain_openai import ChatOpenAI
 
-scene_generator = userdata.SceneGenerator(llm=ChatOpenAI(model_name="gpt-4o-mini", temperature=0.5))
-task_generator = tasks.TaskGenerator(llm=ChatOpenAI(model_name="gpt-4o-mini", temperature=0.5))
+# 하나의 클라이언트를 공유하여 HTTP 연결을 재사용
+llm = ChatOpenAI(model_name="gpt-4o-mini", temperature=0.5)
+
+scene_generator = userdata.SceneGenerator(llm=llm)
+task_generator = tasks.TaskGenerator(llm=llm)
 
 user = userdata.User(name="윤형석",
                      residence="서울",
@@ -29,7 +32,8 @@ user.set_prompt(responses=responses, index=0)
 user.print_self()
 
 task = task_generator.generate_task(user=user, task_name="체중 감량을 위해 운동하기")
-task_generator.generate_subtasks(user=user, task_to_breakdown=task.get_subtask(0))
-task_generator.generate_subtasks(user=user, task_to_breakdown=task.get_subtask(2))
+task_generator.generate_subtasks_batch(user=user,
+                                      tasks_to_breakdown=[task.get_subtask(0),
+                                                          task.get_subtask(2)])
 
 task.print_self()
\ No newline at end of file
@@ -1,34 +1,74 @@
-from pydantic import BaseModel
-from typing import Union, List, Any, Optional, TYPE_CHECKING
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+import logging
+import sys
+from collections import deque
+from typing import Union, List, Any, Optional, ClassVar, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .Task import Task
     from .Subtask import Subtask
 
+logger = logging.getLogger(__name__)
+
 class BaseTask(BaseModel):
     """
     Task와 Subtask의 공통 기능을 제공하는 기본 클래스입니다.
     
     Attributes:
         name (str): 작업의 이름.
-        id (Union[int, str]): 작업의 고유 식별자.
+        id (str): 작업의 고유 식별자. 정수로 주어지면 문자열로 변환됩니다.
         context (str): 작업에 대한 설명 또는 컨텍스트.
         location_tags (List[str]): 작업 위치와 관련된 태그.
         time_tags (List[str]): 작업 시간과 관련된 태그.
         other_tags (List[str]): 기타 관련 태그.
         estimated_minutes (int): 작업 완료 예상 시간(분).
     """
+    # 트리 순회 중 index, estimated_minutes 등을 대량으로 갱신하므로
+    # 할당 시 재검증을 하지 않습니다.
+    model_config = ConfigDict(
+        extra="ignore",
+        validate_assignment=False,
+        revalidate_instances="never",
+    )
+
     name: str
-    id: Union[int, str] = 0
+    id: str = ""
     context: str = ""
     
-    location_tags: List[str] = []
-    time_tags: List[str] = []
-    other_tags: List[str] = []
+    location_tags: List[str] = Field(default_factory=list)
+    time_tags: List[str] = Field(default_factory=list)
+    other_tags: List[str] = Field(default_factory=list)
     estimated_minutes: int = 0
     
     # 타입 힌팅을 위한 subtasks 선언 - 실제 구현은 서브클래스에서
-    subtasks: List[Any] = []
+    subtasks: List[Any] = Field(default_factory=list)
+    
+    # 하위 작업의 supertask_type에 기록되는 이 작업의 유형 - 서브클래스에서 지정
+    task_type: ClassVar[str] = ""
+    
+    @field_validator("id", mode="before")
+    @classmethod
+    def _coerce_id(cls, value: Any) -> str:
+        """
+        정수 ID를 문자열로 정규화합니다.
+        
+        검증 시에만 실행되므로, validate_assignment가 꺼진 Subtask에서는 생성 이후
+        id에 직접 대입한 값은 변환되지 않습니다.
+        """
+        return "" if value is None else str(value)
+    
+    @field_validator("location_tags", "time_tags", "other_tags", mode="after")
+    @classmethod
+    def _intern_tags(cls, tags: List[str]) -> List[str]:
+        """
+        여러 작업에서 반복되는 태그 문자열이 하나의 객체를 공유하도록 intern합니다.
+        """
+        return [sys.intern(tag) for tag in tags]
+    
+    @property
+    def has_subtasks(self) -> bool:
+        """하위 작업이 하나 이상 있는지 여부."""
+        return bool(self.subtasks)
     
     def add_subtask(self, subtask: Any) -> None:
         """
@@ -42,11 +82,25 @@ class BaseTask(BaseModel):
     def set_subtasks_index(self) -> None:
         """
         모든 하위 작업의 인덱스 값을 위치에 따라 업데이트합니다.
+        
+        link_subtasks()로 상위 작업과 함께 한 번의 순회에서 설정합니다.
+        """
+        self.link_subtasks()
+    
+    def link_subtasks(self) -> None:
         """
-        for i, subtask in enumerate(self.subtasks):
-            subtask.index = i + 1
-            if hasattr(subtask, 'has_subtasks') and subtask.has_subtasks:
-                subtask.set_subtasks_index()
+        모든 하위 작업의 상위 작업과 인덱스를 한 번의 너비 우선 순회로 설정합니다.
+        
+        set_subtasks_index()와 set_supertask_of_subtasks()도 이 메서드를 사용합니다.
+        """
+        queue = deque([self])
+        while queue:
+            parent = queue.popleft()
+            for i, subtask in enumerate(parent.subtasks, start=1):
+                subtask.set_supertask(parent, parent.task_type)
+                subtask.index = i
+                if subtask.subtasks:
+                    queue.append(subtask)
     
     def get_subtask(self, index: int) -> Any:
         """
@@ -80,6 +134,23 @@ class BaseTask(BaseModel):
         del self.subtasks[index]
         self.set_subtasks_index()
     
+    def remove_subtasks(self, indices: List[int]) -> None:
+        """
+        여러 인덱스의 하위 작업을 한 번에 제거하고 인덱스를 한 번만 다시 매깁니다.
+        
+        Args:
+            indices (List[int]): 제거할 하위 작업의 인덱스 목록.
+            
+        Raises:
+            IndexError: 인덱스가 범위를 벗어난 경우.
+        """
+        to_remove = set(indices)
+        if any(index < 0 or index >= len(self.subtasks) for index in to_remove):
+            raise IndexError("Index out of bounds.")
+        self.subtasks[:] = [subtask for i, subtask in enumerate(self.subtasks) if i not in to_remove]
+        for i, subtask in enumerate(self.subtasks, start=1):
+            subtask.index = i
+    
     def update_subtask(self, index: int, subtask: Any) -> None:
         """
         특정 인덱스의 하위 작업을 업데이트합니다.
@@ -95,6 +166,36 @@ class BaseTask(BaseModel):
             raise IndexError("Index out of bounds.")
         self.subtasks[index] = subtask
     
+    def _walk(self):
+        """
+        이 작업과 모든 하위 작업을 전위 순서로 순회합니다.
+        
+        명시적 스택을 사용하므로 트리 깊이와 무관하게 재귀 호출이 없습니다.
+        
+        Yields:
+            이 작업 자신과 모든 하위 작업.
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.subtasks:
+                stack.extend(reversed(node.subtasks))
+    
+    def iter_subtasks(self):
+        """
+        중첩된 하위 작업을 포함한 모든 하위 작업을 전위 순서로 하나씩 반환합니다.
+        
+        목록을 만들지 않으므로 전체를 모을 필요가 없는 순회에 사용하세요.
+        
+        Yields:
+            모든 레벨의 하위 작업.
+        """
+        # _walk()의 첫 항목은 이 작업 자신이므로 건너뜀
+        walker = self._walk()
+        next(walker)
+        yield from walker
+    
     def get_all_subtasks(self) -> List[Any]:
         """
         중첩된 하위 작업을 포함한 모든 하위 작업의 평면화된 목록을 반환합니다.
@@ -102,15 +203,48 @@ class BaseTask(BaseModel):
         Returns:
             List: 모든 하위 작업의 목록.
         """
+        return list(self.iter_subtasks())
+    
+    def _summary_lines(self) -> List[str]:
+        """
+        하위 작업을 제외한 이 작업 자체의 출력 줄 목록을 반환합니다.
+        
+        Returns:
+            List[str]: 출력할 줄 목록.
+        """
         # 서브클래스에서 구현
-        pass
+        return []
+    
+    def _render(self) -> str:
+        """
+        작업과 모든 하위 작업의 세부 정보를 하나의 문자열로 만듭니다.
+        
+        Returns:
+            str: 출력할 문자열.
+        """
+        lines: List[str] = []
+        for node in self._walk():
+            lines.extend(node._summary_lines())
+        return "\n".join(lines)
     
     def print_self(self) -> None:
         """
-        작업의 세부 정보를 출력합니다.
+        작업의 세부 정보(하위 작업 포함)를 한 번의 쓰기로 출력합니다.
         """
-        # 서브클래스에서 구현
-        pass
+        sys.stdout.write(self._render() + "\n")
+    
+    def log_self(self, level: int = logging.DEBUG) -> None:
+        """
+        작업의 세부 정보(하위 작업 포함)를 로거로 출력합니다.
+        
+        해당 레벨이 비활성화되어 있으면 트리 순회와 문자열 생성을 모두 건너뜁니다.
+        
+        Args:
+            level (int): 사용할 로그 레벨.
+        """
+        if not logger.isEnabledFor(level):
+            return
+        logger.log(level, "%s", self._render())
     
     def clear_subtasks(self) -> None:
         """
@@ -121,13 +255,31 @@ class BaseTask(BaseModel):
     def set_supertask_of_subtasks(self) -> None:
         """
         이 작업을 모든 하위 작업의 상위 작업으로 설정하고 하위로 전파합니다.
+        
+        link_subtasks()로 인덱스와 함께 한 번의 순회에서 설정합니다.
         """
-        # 서브클래스에서 구현
-        pass
+        self.link_subtasks()
         
     def update_total_minutes(self) -> None:
         """
         하위 작업을 기반으로 예상 시간을 업데이트합니다.
+        
+        하위 작업이 있는 작업의 예상 시간은 하위 작업 예상 시간의 합이 됩니다.
+        명시적 스택을 사용한 후위 순회로 트리를 한 번만 방문합니다.
         """
-        # 서브클래스에서 구현
-        pass
\ No newline at end of file
+        # 각 프레임: [작업, 하위 작업 이터레이터, 하위 작업 예상 시간 합계]
+        stack = [[self, iter(self.subtasks), 0]]
+        while stack:
+            frame = stack[-1]
+            child = next(frame[1], None)
+            if child is None:
+                stack.pop()
+                node, _, total = frame
+                if node.subtasks:
+                    node.estimated_minutes = total
+                if stack:
+                    stack[-1][2] += node.estimated_minutes
+            elif child.subtasks:
+                stack.append([child, iter(child.subtasks), 0])
+            else:
+                frame[2] += child.estimated_minutes
\ No newline at end of file
@@ -1,4 +1,5 @@
-from typing import Union, Any, List, TYPE_CHECKING, Optional
+from typing import Union, Any, List, ClassVar, TYPE_CHECKING, Optional
+from pydantic import Field, PrivateAttr, field_validator
 from .BaseTask import BaseTask
 
 if TYPE_CHECKING:
@@ -10,7 +11,7 @@ class Subtask(BaseTask):
     
     Attributes:
         name (str): 하위 작업의 이름.
-        id (Optional[Union[int, str]]): 하위 작업의 고유 식별자.
+        id (str): 하위 작업의 고유 식별자.
         index (Optional[int]): 상위 작업 내 하위 작업의 인덱스.
         context (Optional[str]): 하위 작업에 대한 설명 또는 컨텍스트.
 
@@ -19,24 +20,31 @@ class Subtask(BaseTask):
         other_tags (List[str]): 기타 관련 태그.
         estimated_minutes (int): 하위 작업 완료 예상 시간(분).
 
-        has_subtasks (bool): 하위 작업에 자체 하위 작업이 있는지 여부.
+        has_subtasks (bool): 하위 작업에 자체 하위 작업이 있는지 여부. subtasks로부터 계산되는 읽기 전용 속성입니다.
         subtasks (Optional[List['Subtask']]): 이 하위 작업에 속하는 하위 작업 목록.
 
-        supertask_id (Optional[Union[int, str]]): 상위 작업의 ID.
+        supertask_id (str): 상위 작업의 ID.
         supertask_type (Optional[str]): 상위 작업의 유형.
     """
     # 하위 작업의 기본 정보
     index: int = 0
     
     # 하위 작업의 하위 작업
-    has_subtasks: bool = False
-    subtasks: List['Subtask'] = []
+    subtasks: List['Subtask'] = Field(default_factory=list)
     
     # 하위 작업의 상위
-    supertask_id: Union[int, str] = 0
+    supertask_id: str = ""
     supertask_type: str = ""
     
-    _supertask: Any = None
+    _supertask: Any = PrivateAttr(default=None)
+    
+    task_type: ClassVar[str] = "subtask"
+    
+    @field_validator("supertask_id", mode="before")
+    @classmethod
+    def _coerce_supertask_id(cls, value: Any) -> str:
+        """정수 ID를 문자열로 정규화합니다."""
+        return "" if value is None else str(value)
     
     def __init__(self, name: str, **kwargs):
         """
@@ -59,43 +67,35 @@ class Subtask(BaseTask):
             task_type (str): 상위 작업의 유형.
         """
         self._supertask = task
-        self.supertask_id = getattr(task, 'id', None)
+        # 할당 시에는 검증기가 실행되지 않으므로 (validate_assignment=False) 여기서 문자열로 정규화
+        task_id = getattr(task, 'id', None)
+        self.supertask_id = "" if task_id is None else str(task_id)
         self.supertask_type = task_type
     
-    def set_supertask_of_subtasks(self) -> None:
-        """모든 하위 작업의 상위 작업을 재귀적으로 설정합니다."""
-        if self.has_subtasks:
-            for subtask in self.subtasks:
-                subtask.set_supertask(self, 'subtask')
-                subtask.set_supertask_of_subtasks()
-    
     def add_subtask(self, subtask: 'Subtask') -> None:
         """이 하위 작업에 하위 작업을 추가합니다.
 
         Args:
             subtask (Subtask): 추가할 하위 작업.
         """
-        if not self.has_subtasks:
-            self.subtasks = []
-            self.has_subtasks = True
         super().add_subtask(subtask)
         subtask.set_supertask(self, 'subtask')
     
-    def print_self(self) -> None:
-        """하위 작업의 세부 정보(하위 작업 포함)를 출력합니다."""
-        print(f"Subtask_{self.index}: {self.name}")
-        print(f"- Context: {self.context}")
-        print(f"- Location Tags: {self.location_tags}")
-        print(f"- Time Tags: {self.time_tags}")
-        print(f"- Other Tags: {self.other_tags}")
-        print(f"- Estimated Minutes: {self.estimated_minutes}")
-        print(f"- Supertask: {self.supertask_id} ({self.supertask_type})")
-        print()
-        
-        if self.has_subtasks:
-            print("Subtasks:")
-            for subtask in self.subtasks:
-                subtask.print_self()
+    def _summary_lines(self) -> List[str]:
+        """하위 작업 자체의 출력 줄 목록을 반환합니다."""
+        lines = [
+            f"Subtask_{self.index}: {self.name}",
+            f"- Context: {self.context}",
+            f"- Location Tags: {self.location_tags}",
+            f"- Time Tags: {self.time_tags}",
+            f"- Other Tags: {self.other_tags}",
+            f"- Estimated Minutes: {self.estimated_minutes}",
+            f"- Supertask: {self.supertask_id} ({self.supertask_type})",
+            "",
+        ]
+        if self.subtasks:
+            lines.append("Subtasks:")
+        return lines
     
     def get_subtask(self, index: int) -> 'Subtask':
         """주어진 인덱스의 하위 작업을 반환합니다.
@@ -110,33 +110,10 @@ class Subtask(BaseTask):
             ValueError: 하위 작업에 하위 작업이 없는 경우.
             IndexError: 인덱스가 범위를 벗어난 경우.
         """
-        if not self.has_subtasks:
+        if not self.subtasks:
             raise ValueError("This subtask has no subtasks.")
         return super().get_subtask(index)
     
-    def get_all_subtasks(self) -> List['Subtask']:
-        """하위 하위 작업을 포함한 모든 하위 작업 목록을 반환합니다.
-
-        Returns:
-            List[Subtask]: 모든 하위 작업이 포함된 목록.
-        """
-        all_subtasks: List['Subtask'] = []
-        
-        if self.has_subtasks:
-            all_subtasks = self.subtasks.copy()    
-            for subtask in self.subtasks:
-                all_subtasks += subtask.get_all_subtasks()
-            
-        return all_subtasks
-    
-    def update_total_minutes(self) -> None:
-        """하위 작업을 기반으로 총 예상 시간을 계산하고 설정합니다."""
-        if self.has_subtasks:
-            self.estimated_minutes = sum([subtask.estimated_minutes for subtask in self.subtasks])
-            
-            for subtask in self.subtasks:
-                subtask.update_total_minutes()
-    
     def update_subtask(self, index: int, subtask: 'Subtask') -> None:
         """주어진 인덱스의 하위 작업을 새 하위 작업으로 업데이트합니다.
 
@@ -148,7 +125,7 @@ class Subtask(BaseTask):
             ValueError: 하위 작업에 하위 작업이 없는 경우.
             IndexError: 인덱스가 범위를 벗어난 경우.
         """
-        if not self.has_subtasks:
+        if not self.subtasks:
             raise ValueError("This subtask has no subtasks.")
         super().update_subtask(index, subtask)
         subtask.set_supertask(self, 'subtask')
@@ -162,18 +139,27 @@ class Subtask(BaseTask):
         Raises:
             IndexError: 제거할 하위 작업이 없거나 인덱스가 범위를 벗어난 경우.
         """
-        if not self.has_subtasks:
+        if not self.subtasks:
             raise IndexError("There are no subtasks to remove.")
         super().remove_subtask(index)
     
+    def remove_subtasks(self, indices: List[int]) -> None:
+        """주어진 인덱스의 하위 작업들을 한 번에 제거합니다.
+
+        Args:
+            indices (List[int]): 제거할 하위 작업의 인덱스 목록.
+
+        Raises:
+            IndexError: 제거할 하위 작업이 없거나 인덱스가 범위를 벗어난 경우.
+        """
+        if not self.subtasks:
+            raise IndexError("There are no subtasks to remove.")
+        super().remove_subtasks(indices)
+    
     def clear_subtasks(self) -> None:
-        """이 하위 작업의 모든 하위 작업을 재귀적으로 지웁니다."""
-        if self.has_subtasks:
-            for subtask in self.subtasks:
-                subtask.clear_subtasks()
-        
-            super().clear_subtasks()
-            self.has_subtasks = False
+        """이 하위 작업의 모든 하위 작업을 하위 트리 전체에 걸쳐 지웁니다."""
+        for node in list(self._walk()):
+            node.subtasks.clear()
 
     def count_subtasks(self) -> int:
         """이 하위 작업의 하위 작업 수를 계산합니다.
@@ -181,4 +167,4 @@ class Subtask(BaseTask):
         Returns:
             int: 하위 작업 수.
         """
-        return len(self.subtasks) if self.has_subtasks else 0
\ No newline at end of file
+        return len(self.subtasks)
\ No newline at end of file
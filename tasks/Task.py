@@ -1,4 +1,5 @@
-from typing import List, Union, TYPE_CHECKING
+from typing import List, Union, ClassVar, TYPE_CHECKING
+from pydantic import ConfigDict, Field, PrivateAttr
 from .BaseTask import BaseTask
 
 if TYPE_CHECKING:
@@ -11,7 +12,7 @@ class Task(BaseTask):
 
     Attributes:
         name (str): 작업의 이름.
-        id (Optional[Union[int, str]]): 작업의 고유 식별자.
+        id (str): 작업의 고유 식별자.
         context (str): 작업에 대한 설명 또는 컨텍스트.
         
         location_tags (List[str]): 작업 위치와 관련된 태그.
@@ -22,14 +23,14 @@ class Task(BaseTask):
         subtasks (List[Subtask]): 이 작업에 속하는 하위 작업 목록.
     """
     # LLM 생성 여부를 추적하는 프라이빗 필드
-    _llm_generated: bool = False
+    _llm_generated: bool = PrivateAttr(default=False)
 
     # 문자열 기반 타입 어노테이션 사용
-    subtasks: List['Subtask'] = []
+    subtasks: List['Subtask'] = Field(default_factory=list)
     
-    class Config:
-        validate_assignment = True
-        extra = "forbid"
+    task_type: ClassVar[str] = "task"
+    
+    model_config = ConfigDict(validate_assignment=True, extra="forbid")
         
     def __init__(self, **data):
         super().__init__(**data)
@@ -53,14 +54,6 @@ class Task(BaseTask):
         """
         return cls(name=name, **kwargs)
     
-    def set_supertask_of_subtasks(self) -> None:
-        """
-        이 작업을 모든 하위 작업의 상위 작업으로 설정하고 하위로 전파합니다.
-        """
-        for subtask in self.subtasks:
-            subtask.set_supertask(self, 'task')
-            subtask.set_supertask_of_subtasks()
-    
     def add_subtask(self, subtask: 'Subtask') -> None:
         """
         새 하위 작업을 이 작업에 추가합니다.
@@ -71,19 +64,6 @@ class Task(BaseTask):
         super().add_subtask(subtask)
         subtask.set_supertask(self, 'task')
     
-    def get_all_subtasks(self) -> List['Subtask']:
-        """
-        중첩된 하위 작업을 포함한 모든 하위 작업의 평면화된 목록을 가져옵니다.
-
-        Returns:
-            List[Subtask]: 모든 레벨의 하위 작업.
-        """
-        all_subtasks: List['Subtask'] = []
-        for subtask in self.subtasks:
-            all_subtasks.append(subtask)
-            all_subtasks.extend(subtask.get_all_subtasks())
-        return all_subtasks
-    
     def set_supertask(self) -> None:
         """
         모든 하위 작업의 상위 작업을 설정합니다.
@@ -92,21 +72,20 @@ class Task(BaseTask):
             subtask.supertask = self
             subtask.set_supertask()
     
-    def print_self(self) -> None:
-        """
-        작업의 세부 정보(하위 작업 포함)를 출력합니다.
-        """
-        print(f"Task: {self.name}")
-        print(f"- Context: {self.context}")
-        print(f"- Location Tags: {self.location_tags}")
-        print(f"- Time Tags: {self.time_tags}")
-        print(f"- Other Tags: {self.other_tags}")
-        print(f"- Estimated Minutes: {self.estimated_minutes}")
-        print()
-        
-        print("Subtasks:")
-        for subtask in self.subtasks:
-            subtask.print_self()
+    def _summary_lines(self) -> List[str]:
+        """
+        작업 자체의 출력 줄 목록을 반환합니다.
+        """
+        return [
+            f"Task: {self.name}",
+            f"- Context: {self.context}",
+            f"- Location Tags: {self.location_tags}",
+            f"- Time Tags: {self.time_tags}",
+            f"- Other Tags: {self.other_tags}",
+            f"- Estimated Minutes: {self.estimated_minutes}",
+            "",
+            "Subtasks:",
+        ]
     
     def calculate_total_minutes(self) -> int:
         """
@@ -115,11 +94,10 @@ class Task(BaseTask):
         Returns:
             int: 총 예상 시간(분).
         """
-        total_minutes = 0
-        for subtask in self.subtasks:
+        subs = self.subtasks
+        for subtask in subs:
             subtask.update_total_minutes()
-            total_minutes += subtask.estimated_minutes
-        return total_minutes
+        return sum(subtask.estimated_minutes for subtask in subs)
     
     def update_total_minutes(self) -> None:
         """
@@ -1,16 +1,68 @@
 from pydantic import BaseModel
-from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
-from typing import Optional, Dict, Any, List
+from langchain_core.output_parsers import PydanticOutputParser, StrOutputParser
+from langchain_core.runnables import RunnableLambda
+from typing import Optional, Dict, Any, List, Iterator, TYPE_CHECKING
 import json
+import logging
+from functools import lru_cache
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 from .Task import *
 from .Subtask import *
 from userdata import *
 
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+logger = logging.getLogger(__name__)
+
+def _extract_json(text: str) -> str:
+    """LLM 출력에서 마크다운 JSON 코드 블록의 내용을 추출합니다. 코드 블록이 없으면 원래 문자열을 사용합니다."""
+    i = text.find("```")
+    if i < 0:
+        return text.strip()
+    rest = text[i + 3:]
+    if rest.startswith("json"):
+        rest = rest[4:]
+    j = rest.find("```")
+    return (rest[:j] if j >= 0 else rest).strip()
+
+# 하위 작업 체인에서 공유하는 문자열 파서
+_STR_PARSER = StrOutputParser()
+
+def _length_order(payloads: List[Dict[str, Any]]) -> List[int]:
+    """
+    배치 요청을 입력 길이 순으로 정렬한 인덱스를 반환합니다.
+    
+    비슷한 길이의 요청이 같은 시점에 처리되도록 해, 긴 요청 하나 때문에
+    동시 요청 묶음 전체가 늦어지는 일을 줄입니다.
+    """
+    return sorted(range(len(payloads)), key=lambda i: len(payloads[i]["task"]))
+
+def _restore_order(order: List[int], outputs: List[Any]) -> List[Any]:
+    """_length_order로 정렬해 얻은 결과를 원래 요청 순서로 되돌립니다."""
+    restored = [None] * len(order)
+    for i, output in zip(order, outputs):
+        restored[i] = output
+    return restored
+
+@lru_cache(maxsize=None)
+def _format_instructions_for(model_cls: type) -> str:
+    """모델 클래스의 출력 형식 지침을 반환합니다. 스키마는 클래스마다 고정이므로 한 번만 생성합니다."""
+    return PydanticOutputParser(pydantic_object=model_cls).get_format_instructions()
+
+# 하위 작업 생성 시 LLM에 전달하는 태스크 필드
+_TASK_INFO_FIELDS = {"name", "context", "estimated_minutes",
+                     "location_tags", "time_tags", "other_tags"}
+
 class TaskGenerator:
-    def __init__(self, llm: ChatOpenAI):
+    def __init__(self, llm: 'ChatOpenAI'):
         """
         Initialize a new task generator with the given LLM instance.
         
@@ -32,29 +84,48 @@ class TaskGenerator:
         각각의 Subtask에 적절한 태그를 부여하세요.
         """
         
+        # 요청마다 바뀌는 할 일은 마지막에 두어 앞부분을 프롬프트 캐시에 재사용
         self.prompt_kwargs: str = """
         사용자의 인적 정보: {bio}
         사용자의 하루 일과: {prompt}
         사용자가 입력한 할 일: {task}
-        지침: {format_instruction}
         """
         
         # 파서 초기화
         self.task_parser = PydanticOutputParser(pydantic_object=Task)
-        self.subtask_parser = PydanticOutputParser(pydantic_object=Subtask)
+        self._task_format = _format_instructions_for(Task)
+        self._subtask_format = _format_instructions_for(Subtask)
         
-        # 프롬프트 템플릿 초기화
-        self._prompt_template = self._create_prompt_template()
+        # 프롬프트 템플릿과 체인 초기화
+        self._rebuild_chains()
     
     def _create_prompt_template(self) -> ChatPromptTemplate:
         """
         현재 프롬프트 설정으로 ChatPromptTemplate 객체 생성
         
+        지시문과 출력 형식 지침은 시스템 메시지에, 요청마다 바뀌는 사용자 정보와
+        할 일은 사용자 메시지에 두어 LLM 제공자의 프롬프트 캐시가 고정된 앞부분을
+        재사용할 수 있게 합니다.
+        
         Returns:
             ChatPromptTemplate: 현재 설정으로 생성된 프롬프트 템플릿
         """
-        template_str = f"{self.prompt_main}\n{self.prompt_kwargs}"
-        return ChatPromptTemplate.from_template(template_str)
+        return ChatPromptTemplate.from_messages([
+            ("system", f"{self.prompt_main}\n지침: {{format_instruction}}"),
+            ("human", self.prompt_kwargs),
+        ])
+    
+    def _rebuild_chains(self) -> None:
+        """
+        현재 프롬프트 설정으로 프롬프트 템플릿과 LLM 체인을 다시 구성합니다.
+        """
+        self._prompt_template = self._create_prompt_template()
+        task_prompt = self._prompt_template.partial(format_instruction=self._task_format)
+        subtask_prompt = self._prompt_template.partial(format_instruction=self._subtask_format)
+        self._task_chain = task_prompt | self.llm | self.task_parser
+        self._subtask_chain_str = subtask_prompt | self.llm | _STR_PARSER
+        # 파싱까지 체인 안에서 처리해 배치 호출 시 응답이 도착하는 대로 파싱
+        self._subtask_chain = self._subtask_chain_str | RunnableLambda(SubtaskParser.parse)
         
     def set_main_prompt(self, prompt: str) -> None:
         """
@@ -63,8 +134,10 @@ class TaskGenerator:
         Args:
             prompt (str): The prompt to use for generating tasks.
         """
+        if prompt == self.prompt_main:
+            return
         self.prompt_main = prompt
-        self._prompt_template = self._create_prompt_template()
+        self._rebuild_chains()
     
     def set_context_prompt(self, prompt_context: str) -> None:
         """
@@ -73,165 +146,390 @@ class TaskGenerator:
         Args:
             prompt_context (str): The context prompt to use for generating tasks.
         """
+        if prompt_context == self.prompt_kwargs:
+            return
         self.prompt_kwargs = prompt_context
-        self._prompt_template = self._create_prompt_template()
+        self._rebuild_chains()
 
-    def generate_task(self, user: User, task_name: str) -> Task:
+    def _task_payload(self, user: User, task_name: str) -> Dict[str, Any]:
         """
-        주어진 사용자 정보와 태스크 이름을 사용하여 태스크를 생성합니다.
+        태스크 생성을 위한 LLM 입력을 만듭니다.
         
         Args:
             user (User): 사용자 정보
             task_name (str): 생성할 태스크의 이름
             
         Returns:
-            Task: 생성된 태스크 객체
+            Dict[str, Any]: 프롬프트 템플릿에 전달할 입력
         """
         if not task_name or not task_name.strip():
             raise ValueError("태스크 이름은 비어 있을 수 없습니다.")
-            
-        chain = self._prompt_template | self.llm | self.task_parser
-        format_instruction = self.task_parser.get_format_instructions()
-                
-        task = chain.invoke({
+        
+        return {
             "bio": user.bio,
             "prompt": user.prompt,
-            "task": task_name,
-            "format_instruction": format_instruction})
+            "task": task_name}
+    
+    @staticmethod
+    def _finalize_task(task: Task) -> Task:
+        """
+        LLM이 생성한 태스크의 하위 작업 관계와 예상 시간을 설정합니다.
         
-        task.set_supertask_of_subtasks()
-        task.set_subtasks_index()
+        Args:
+            task (Task): LLM이 생성한 태스크
+            
+        Returns:
+            Task: 관계와 예상 시간이 설정된 태스크
+        """
+        task.link_subtasks()
         task.update_total_minutes()
         return task
 
-    def generate_subtasks(self, user: User, task_to_breakdown: Task|Subtask):
+    def generate_task(self, user: User, task_name: str) -> Task:
         """
-        주어진 사용자 정보와 태스크를 세부적으로 나눕니다.
+        주어진 사용자 정보와 태스크 이름을 사용하여 태스크를 생성합니다.
+        
+        Args:
+            user (User): 사용자 정보
+            task_name (str): 생성할 태스크의 이름
+            
+        Returns:
+            Task: 생성된 태스크 객체
+        """
+        task = self._task_chain.invoke(self._task_payload(user, task_name))
+        return self._finalize_task(task)
+
+    def generate_tasks(self, user: User, task_names: List[str],
+                       max_concurrency: int = 8) -> List[Task]:
+        """
+        여러 태스크를 동시에 LLM에 요청하여 생성합니다.
+        
+        Args:
+            user (User): 사용자 정보
+            task_names (List[str]): 생성할 태스크의 이름 목록
+            max_concurrency (int): 동시에 보낼 최대 LLM 요청 수
+            
+        Returns:
+            List[Task]: 생성된 태스크 목록 (task_names와 같은 순서)
+        """
+        payloads = [self._task_payload(user, task_name) for task_name in task_names]
+        order = _length_order(payloads)
+        tasks = self._task_chain.batch([payloads[i] for i in order],
+                                       config={"max_concurrency": max_concurrency})
+        tasks = _restore_order(order, tasks)
+        return [self._finalize_task(task) for task in tasks]
+
+    async def agenerate_task(self, user: User, task_name: str) -> Task:
+        """
+        generate_task의 비동기 버전입니다. 여러 LLM 호출을 asyncio로 겹쳐 실행할 때 사용합니다.
+        
+        Args:
+            user (User): 사용자 정보
+            task_name (str): 생성할 태스크의 이름
+            
+        Returns:
+            Task: 생성된 태스크 객체
+        """
+        task = await self._task_chain.ainvoke(self._task_payload(user, task_name))
+        return self._finalize_task(task)
+
+    async def agenerate_tasks(self, user: User, task_names: List[str],
+                              max_concurrency: int = 8) -> List[Task]:
+        """
+        generate_tasks의 비동기 버전입니다.
+        
+        Args:
+            user (User): 사용자 정보
+            task_names (List[str]): 생성할 태스크의 이름 목록
+            max_concurrency (int): 동시에 보낼 최대 LLM 요청 수
+            
+        Returns:
+            List[Task]: 생성된 태스크 목록 (task_names와 같은 순서)
+        """
+        payloads = [self._task_payload(user, task_name) for task_name in task_names]
+        order = _length_order(payloads)
+        tasks = await self._task_chain.abatch([payloads[i] for i in order],
+                                              config={"max_concurrency": max_concurrency})
+        tasks = _restore_order(order, tasks)
+        return [self._finalize_task(task) for task in tasks]
+
+    def _subtask_payload(self, user: User, task_to_breakdown: Task|Subtask) -> Dict[str, Any]:
+        """
+        태스크를 세부적으로 나누기 위한 LLM 입력을 만듭니다.
         
         Args:
             user (User): 사용자 정보
             task_to_breakdown (Task|Subtask): 세부적으로 나눌 태스크
+            
+        Returns:
+            Dict[str, Any]: 프롬프트 템플릿에 전달할 입력
         """
         if not task_to_breakdown:
             raise ValueError("세부적으로 나눌 태스크가 주어지지 않았습니다.")
         
-        # LLM에서 문자열 응답 직접 가져오기 
-        from langchain_core.output_parsers import StrOutputParser
-        str_parser = StrOutputParser()
-        chain = self._prompt_template | self.llm | str_parser
-        format_instruction = self.subtask_parser.get_format_instructions()
-        
         # LLM에게 태스크 이름과 컨텍스트 전달
-        task_info = {
-            "name": task_to_breakdown.name,
-            "context": task_to_breakdown.context,
-            "estimated_minutes": task_to_breakdown.estimated_minutes,
-            "location_tags": task_to_breakdown.location_tags,
-            "time_tags": task_to_breakdown.time_tags,
-            "other_tags": task_to_breakdown.other_tags
-        }
+        # (한글이 \uXXXX로 이스케이프되지 않아 프롬프트 토큰이 줄어듭니다)
+        task_info = task_to_breakdown.model_dump_json(include=_TASK_INFO_FIELDS)
         
-        # LLM 호출 및 응답 가져오기
-        raw_output = chain.invoke({
+        return {
             "bio": user.bio,
             "prompt": user.prompt, 
-            "task": json.dumps(task_info),
-            "format_instruction": format_instruction
-        })
-        
-        # 커스텀 파서로 응답 처리
-        subtasks = SubtaskParser.parse(raw_output)
+            "task": task_info
+        }
+    
+    @staticmethod
+    def _attach_subtasks(task_to_breakdown: Task|Subtask, subtasks: List[Subtask]) -> Task|Subtask:
+        """
+        파싱된 하위 작업을 태스크에 설정하고 관계와 예상 시간을 갱신합니다.
         
+        Args:
+            task_to_breakdown (Task|Subtask): 세부적으로 나눌 태스크
+            subtasks (List[Subtask]): 설정할 하위 작업 목록
+            
+        Returns:
+            Task|Subtask: 하위 작업이 설정된 태스크
+        """
         # 생성된 subtasks 설정
         task_to_breakdown.subtasks = subtasks
-        task_to_breakdown.has_subtasks = len(subtasks) > 0
         
         # 관계 설정
-        task_to_breakdown.set_supertask_of_subtasks()
-        task_to_breakdown.set_subtasks_index()
+        task_to_breakdown.link_subtasks()
         task_to_breakdown.update_total_minutes()
         
         return task_to_breakdown
 
+    def generate_subtasks(self, user: User, task_to_breakdown: Task|Subtask):
+        """
+        주어진 사용자 정보와 태스크를 세부적으로 나눕니다.
+        
+        Args:
+            user (User): 사용자 정보
+            task_to_breakdown (Task|Subtask): 세부적으로 나눌 태스크
+        """
+        payload = self._subtask_payload(user, task_to_breakdown)
+        
+        # LLM 호출 및 커스텀 파서로 응답 처리
+        subtasks = self._subtask_chain.invoke(payload)
+        
+        return self._attach_subtasks(task_to_breakdown, subtasks)
+
+    async def agenerate_subtasks(self, user: User, task_to_breakdown: Task|Subtask) -> Task|Subtask:
+        """
+        generate_subtasks의 비동기 버전입니다.
+        
+        Args:
+            user (User): 사용자 정보
+            task_to_breakdown (Task|Subtask): 세부적으로 나눌 태스크
+            
+        Returns:
+            Task|Subtask: 하위 작업이 설정된 태스크
+        """
+        payload = self._subtask_payload(user, task_to_breakdown)
+        subtasks = await self._subtask_chain.ainvoke(payload)
+        return self._attach_subtasks(task_to_breakdown, subtasks)
+
+    def generate_subtasks_stream(self, user: User, task_to_breakdown: Task|Subtask) -> Iterator[Subtask]:
+        """
+        LLM 응답을 스트리밍으로 받아, 완성된 하위 작업을 생성되는 즉시 하나씩 반환합니다.
+        
+        스트림이 끝나면 generate_subtasks와 마찬가지로 태스크의 하위 작업, 관계, 예상 시간이 설정됩니다.
+        
+        Args:
+            user (User): 사용자 정보
+            task_to_breakdown (Task|Subtask): 세부적으로 나눌 태스크
+            
+        Yields:
+            Subtask: 완성된 하위 작업 (index와 상위 작업이 설정된 상태)
+        """
+        payload = self._subtask_payload(user, task_to_breakdown)
+        scanner = _SubtaskStreamScanner()
+        chunks = []
+        subtasks = []
+        
+        for chunk in self._subtask_chain_str.stream(payload):
+            chunks.append(chunk)
+            for obj_str in scanner.feed(chunk):
+                try:
+                    subtask = SubtaskParser._create_subtask_from_dict(_loads(obj_str))
+                except Exception as e:
+                    logger.warning("하위 작업 파싱 오류: %s", e)
+                    continue
+                subtask.index = len(subtasks) + 1
+                subtask.set_supertask(task_to_breakdown, task_to_breakdown.task_type)
+                # 반환 전에 하위 트리 전체의 index와 상위 작업을 설정
+                subtask.link_subtasks()
+                subtasks.append(subtask)
+                yield subtask
+        
+        # 목록 형태가 아닌 응답(단일 하위 작업 등)은 전체 응답을 한 번에 파싱
+        if not subtasks:
+            subtasks = SubtaskParser.parse("".join(chunks))
+            self._attach_subtasks(task_to_breakdown, subtasks)
+            yield from subtasks
+            return
+        
+        self._attach_subtasks(task_to_breakdown, subtasks)
+
+    def generate_subtasks_batch(self, user: User, tasks_to_breakdown: List[Task|Subtask],
+                                max_concurrency: int = 8) -> List[Task|Subtask]:
+        """
+        여러 태스크를 동시에 LLM에 요청하여 세부적으로 나눕니다.
+        
+        Args:
+            user (User): 사용자 정보
+            tasks_to_breakdown (List[Task|Subtask]): 세부적으로 나눌 태스크 목록
+            max_concurrency (int): 동시에 보낼 최대 LLM 요청 수
+            
+        Returns:
+            List[Task|Subtask]: 하위 작업이 설정된 태스크 목록
+        """
+        payloads = [self._subtask_payload(user, task) for task in tasks_to_breakdown]
+        order = _length_order(payloads)
+        results = self._subtask_chain.batch([payloads[i] for i in order],
+                                            config={"max_concurrency": max_concurrency})
+        results = _restore_order(order, results)
+        
+        return [self._attach_subtasks(task, subtasks)
+                for task, subtasks in zip(tasks_to_breakdown, results)]
+
 class SubtaskParser:
     """Subtask 객체를 생성하는 커스텀 파서 클래스"""
     
     @staticmethod
-    def _create_subtask_from_dict(data: Dict[str, Any]) -> Subtask:
-        """딕셔너리에서 Subtask 객체 생성"""
-        # subtasks 필드를 임시로 빈 리스트로 설정
-        has_nested_subtasks = False
-        nested_subtasks_data = []
-        
-        if "subtasks" in data and data["subtasks"] and isinstance(data["subtasks"], list):
-            has_nested_subtasks = True
-            # subtasks는 나중에 처리하기 위해 임시 저장
-            nested_subtasks_data = data["subtasks"]
-        
+    def _build_subtask(data: Dict[str, Any]) -> Subtask:
+        """딕셔너리에서 하위 작업 없이 Subtask 객체 하나를 생성"""
         # 필수 필드가 없으면 기본값 제공
         name = data.get("name", "Unnamed Subtask")
         
-        # Subtask 객체 생성
-        subtask = Subtask(
+        return Subtask(
             name=name,
-            id=data.get("id", 0),
+            id=data.get("id", ""),
             index=data.get("index", 0),
             context=data.get("context", ""),
             location_tags=data.get("location_tags", []),
             time_tags=data.get("time_tags", []),
             other_tags=data.get("other_tags", []),
             estimated_minutes=data.get("estimated_minutes", 0),
-            has_subtasks=has_nested_subtasks,
-            subtasks=[],  # 빈 리스트로 초기화
-            supertask_id=data.get("supertask_id", 0),
+            subtasks=[],  # 중첩된 subtasks는 _create_subtask_from_dict에서 연결
+            supertask_id=data.get("supertask_id", ""),
             supertask_type=data.get("supertask_type", "")
         )
+    
+    @staticmethod
+    def _create_subtask_from_dict(data: Dict[str, Any]) -> Subtask:
+        """딕셔너리에서 Subtask 객체 생성
         
-        # 중첩된 subtasks 처리
-        if has_nested_subtasks:
+        중첩된 subtasks를 재귀 대신 명시적인 스택으로 처리하므로
+        깊게 중첩된 LLM 출력에서도 재귀 한도에 걸리지 않습니다.
+        """
+        root = SubtaskParser._build_subtask(data)
+        stack = [(data, root)]
+        while stack:
+            node_data, node = stack.pop()
+            nested_subtasks_data = node_data.get("subtasks")
+            if not nested_subtasks_data or not isinstance(nested_subtasks_data, list):
+                continue
             for nested_data in nested_subtasks_data:
-                nested_subtask = SubtaskParser._create_subtask_from_dict(nested_data)
-                subtask.add_subtask(nested_subtask)
+                nested_subtask = SubtaskParser._build_subtask(nested_data)
+                node.add_subtask(nested_subtask)
+                stack.append((nested_data, nested_subtask))
         
-        return subtask
+        return root
     
     @staticmethod
     def parse(llm_output: str) -> List[Subtask]:
         """LLM 출력을 파싱하여 Subtask 객체 목록 반환"""
         try:
-            # 마크다운 코드 블록에서 JSON 추출
-            import re
-            json_match = re.search(r'```(?:json)?\s*([\s\S]+?)\s*```', llm_output)
-            if json_match:
-                # 코드 블록 내용만 추출
-                json_str = json_match.group(1)
-            else:
-                # 코드 블록이 없으면 원래 문자열 사용
-                json_str = llm_output
-            
-            # 공백 제거 및 JSON 파싱
-            json_str = json_str.strip()
-            data = json.loads(json_str)
-            subtasks = []
+            # 마크다운 코드 블록에서 JSON 추출 후 파싱
+            data = _loads(_extract_json(llm_output))
             
             # 응답이 직접 subtasks 목록을 포함하는 경우
             if isinstance(data, dict) and "subtasks" in data and isinstance(data["subtasks"], list):
-                for subtask_data in data["subtasks"]:
-                    subtask = SubtaskParser._create_subtask_from_dict(subtask_data)
-                    subtasks.append(subtask)
+                items = data["subtasks"]
             # 응답 자체가 subtask 목록인 경우
             elif isinstance(data, list):
-                for subtask_data in data:
-                    subtask = SubtaskParser._create_subtask_from_dict(subtask_data)
-                    subtasks.append(subtask)
+                items = data
             # 응답 자체가 단일 subtask인 경우
             else:
-                subtask = SubtaskParser._create_subtask_from_dict(data)
-                subtasks.append(subtask)
+                items = [data]
                     
-            return subtasks
+            return [SubtaskParser._create_subtask_from_dict(subtask_data) for subtask_data in items]
         except Exception as e:
-            print(f"파싱 오류: {e}")
+            logger.warning("파싱 오류: %s", e)
             # 디버깅용 출력
-            print(f"LLM 출력: {llm_output}")
-            return []
\ No newline at end of file
+            logger.debug("LLM 출력: %s", llm_output)
+            return []
+
+
+class _SubtaskStreamScanner:
+    """스트리밍 LLM 출력에서 완성된 하위 작업 JSON 객체를 찾아내는 스캐너
+    
+    `{"subtasks": [{...}, ...]}` 형태의 응답에서는 최상위 "subtasks" 키의 배열,
+    `[{...}, ...]` 형태의 응답에서는 최상위 배열의 원소 객체가 닫히는 즉시 해당 문자열을
+    반환합니다. 문자열 안의 괄호는 무시합니다.
+    """
+    
+    def __init__(self):
+        self._buf = ""
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._key_chars: List[str] = []  # 최상위 객체에서 읽고 있는 문자열
+        self._last_string: Optional[str] = None  # 최상위 객체에서 마지막으로 읽은 문자열
+        self._key: Optional[str] = None  # 최상위 객체에서 현재 값의 키
+        self._items_depth: Optional[int] = None  # 하위 작업 배열의 깊이
+        self._in_items = False  # 하위 작업 배열 안에 있는지 여부
+        self._item_start: Optional[int] = None  # 현재 하위 작업 객체의 시작 위치
+    
+    def feed(self, chunk: str) -> List[str]:
+        """새 조각을 추가하고, 이번에 완성된 하위 작업 객체 문자열 목록을 반환합니다."""
+        offset = len(self._buf)
+        self._buf += chunk
+        stack = self._stack
+        completed = []
+        
+        for i, ch in enumerate(chunk, start=offset):
+            top_level = len(stack) == 1 and stack[0] == "{"
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    if top_level:
+                        self._key_chars.append(ch)
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if top_level:
+                        self._last_string = "".join(self._key_chars)
+                elif top_level:
+                    self._key_chars.append(ch)
+            elif ch == '"':
+                self._in_string = True
+                self._key_chars.clear()
+            elif ch == ":" and top_level:
+                self._key = self._last_string
+            elif ch == "," and top_level:
+                self._key = None
+            elif ch == "{" or ch == "[":
+                if ch == "[" and self._items_depth is None and (not stack or (top_level and self._key == "subtasks")):
+                    self._items_depth = len(stack) + 1
+                    self._in_items = True
+                elif ch == "{" and self._in_items and self._item_start is None and len(stack) == self._items_depth:
+                    self._item_start = i
+                stack.append(ch)
+            elif ch == "}" or ch == "]":
+                if ch == "}" and self._item_start is not None and len(stack) - 1 == self._items_depth:
+                    completed.append(self._buf[self._item_start:i + 1])
+                    self._item_start = None
+                elif ch == "]" and self._in_items and len(stack) == self._items_depth:
+                    self._in_items = False
+                if stack:
+                    stack.pop()
+        
+        # 아직 완성되지 않은 객체만 버퍼에 남김
+        if self._item_start is None:
+            self._buf = ""
+        else:
+            self._buf = self._buf[self._item_start:]
+            self._item_start = 0
+        return completed
@@ -1,3 +1,4 @@
+import sys
 from pydantic import BaseModel
 
 class Scene(BaseModel):
@@ -6,11 +7,16 @@ class Scene(BaseModel):
     time_tags: list[str]
     other_tags: list[str]
     
+    def _summary_lines(self) -> list[str]:
+        return [
+            f"Scene: {self.name}",
+            f"- Location Tags: {self.location_tags}",
+            f"- Time Tags: {self.time_tags}",
+            f"- Other Tags: {self.other_tags}",
+        ]
+    
     def print_self(self):
-        print(f"Scene: {self.name}")
-        print(f"- Location Tags: {self.location_tags}")
-        print(f"- Time Tags: {self.time_tags}")
-        print(f"- Other Tags: {self.other_tags}")
+        sys.stdout.write("\n".join(self._summary_lines()) + "\n")
 
 class Scenes(BaseModel):
     scenes: list[Scene]
\ No newline at end of file
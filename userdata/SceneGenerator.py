@@ -1,13 +1,86 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from hashlib import blake2b
+
+try:
+    import orjson
+
+    def _dumps_sorted(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+except ImportError:
+    # orjson과 같은 바이트를 만들도록 구분자를 맞춤 (캐시 키가 설치 환경에 따라 달라지지 않도록)
+    def _dumps_sorted(obj) -> bytes:
+        return json.dumps(obj, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode()
+
+from typing import TYPE_CHECKING, Optional
+
 from pydantic import BaseModel
-from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import PydanticOutputParser
 
 from .Scene import *
 from .Userdata import *
 
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+logger = logging.getLogger(__name__)
+
+# 응답 캐시 기본 위치와 유효 기간(초)
+DEFAULT_CACHE_PATH = os.path.expanduser("~/.ggtdd_llm_cache.sqlite3")
+DEFAULT_CACHE_TTL = 86400
+
+class _ResponseCache:
+    """
+    A small SQLite-backed key/value store with per-entry expiry.
+    
+    Entries survive process restarts when backed by a file, so repeated runs
+    with the same input skip the LLM call. Expired rows are purged on open.
+    If the file cannot be opened, the cache falls back to memory.
+    """
+    
+    def __init__(self, path: str, ttl: int):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        try:
+            self._conn = self._open(path)
+        except sqlite3.Error as e:
+            logger.warning("응답 캐시 파일을 열 수 없어 메모리 캐시를 사용합니다 (%s): %s", path, e)
+            self._conn = self._open(":memory:")
+    
+    @staticmethod
+    def _open(path: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        try:
+            conn.execute("CREATE TABLE IF NOT EXISTS responses "
+                         "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)")
+            conn.execute("DELETE FROM responses WHERE expires <= ?", (time.time(),))
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+    
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM responses WHERE key = ? AND expires > ?",
+                                     (key, time.time())).fetchone()
+        return row[0] if row else None
+    
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO responses (key, value, expires) VALUES (?, ?, ?)",
+                               (key, value, time.time() + self.ttl))
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
 class SceneGenerator:
-    llm: ChatOpenAI
+    llm: 'ChatOpenAI'
 
     ### Prompt for generating tasks    
     _prompt: ChatPromptTemplate
@@ -23,22 +96,30 @@ class SceneGenerator:
         공간 태그에는 사용자의 위치, 활동하는 장소 등의 정보를 포함하세요.
         기타 태그에는 시간과 공간 태그에 포함되지 않지만 할 일의 맥락과 상황을 검색하기에 좋은 정보를 포함하세요.
         """
+    # 요청마다 바뀌는 장면은 마지막에 두어 앞부분을 프롬프트 캐시에 재사용
     prompt_context: str = """
         사용자 정보: {bio}
         장면: {scenes}
-        지침: {format_instruction}
         """
     
-    def __init__(self, llm: ChatOpenAI):
+    def __init__(self, llm: 'ChatOpenAI', cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+                 cache_ttl: int = DEFAULT_CACHE_TTL):
         """
         Initialize a new task generator with the given LLM instance.
         
         Args:
             llm (ChatOpenAI): The LLM instance to use for generating tasks.
+            cache_path (Optional[str]): SQLite file for the response cache, shared across runs.
+                Pass None to keep the cache in memory for this instance only.
+            cache_ttl (int): How long a cached response stays valid, in seconds.
         """
         self.llm = llm
-        self._prompt = ChatPromptTemplate.from_template(self.get_prompt_string())
         self.scene_parser = PydanticOutputParser(pydantic_object=Scenes)
+        self._format_instruction = self.scene_parser.get_format_instructions()
+        self._build_chain()
+        
+        # 동일한 입력에 대한 LLM 응답 캐시 (key -> Scenes JSON, 실행 간 유지)
+        self._cache = _ResponseCache(cache_path or ":memory:", cache_ttl)
         
     def set_main_prompt(self, prompt: str) -> None:
         """
@@ -47,8 +128,10 @@ class SceneGenerator:
         Args:
             prompt (str): The prompt to use for generating tasks.
         """
-        
+        if prompt == self.prompt_main:
+            return
         self.prompt_main = prompt
+        self._build_chain()
     
     def set_context_prompt(self, prompt_context: str) -> None:
         """
@@ -57,9 +140,22 @@ class SceneGenerator:
         Args:
             prompt_context (str): The context prompt to use for generating tasks.
         """
-        
+        if prompt_context == self.prompt_context:
+            return
         self.prompt_context = prompt_context
+        self._build_chain()
     
+    def _build_chain(self) -> None:
+        """
+        Compile the prompt template and compose the scene generation chain.
+        """
+        # 지시문과 출력 형식 지침은 고정된 시스템 메시지로 두어 프롬프트 캐시에 재사용
+        self._prompt = ChatPromptTemplate.from_messages([
+            ("system", f"{self.prompt_main}\n지침: {{format_instruction}}"),
+            ("human", self.prompt_context),
+        ]).partial(format_instruction=self._format_instruction)
+        self._chain = (self._prompt | self.llm | self.scene_parser).with_config(run_name="scene_generator")
+
     def get_prompt_template(self):
         """
         Get the ChatPromptTemplate object for generating tasks.
@@ -67,23 +163,143 @@ class SceneGenerator:
         Returns:
             ChatPromptTemplate: The prompt template object.
         """
-        template_str = f"{self.prompt_main}\n{self.prompt_context}"
-        return ChatPromptTemplate.from_template(template_str)
+        return self._prompt
 
     def get_prompt_string(self):
         """
-        Get the raw prompt string.
-        
+        Get the raw prompt string, rendered from the compiled template.
+
+        The format instruction is filled in and the per-request variables are
+        left as placeholders, so this matches what is sent to the LLM.
+
         Returns:
             str: The raw prompt string.
         """
-        return f"{self.prompt_main}\n{self.prompt_context}"
+        placeholders = {name: f"{{{name}}}" for name in self._prompt.input_variables}
+        messages = self._prompt.format_messages(**placeholders)
+        return "\n".join(message.content for message in messages)
+
+    def _cache_key(self, user: User, scenes: list[str]) -> str:
+        """
+        Build a stable cache key from everything that affects the LLM response.
+        
+        Args:
+            user (User): The user whose bio is sent to the LLM.
+            scenes (list[str]): The scene names sent to the LLM.
+        
+        Returns:
+            str: The hex digest identifying this request.
+        """
+        payload = {
+            "bio": user.bio,
+            "scenes": scenes,
+            "prompt": self.get_prompt_string(),
+            "model_name": getattr(self.llm, "model_name", None),
+            "temperature": getattr(self.llm, "temperature", None),
+        }
+        return blake2b(_dumps_sorted(payload)).hexdigest()
+
+    def clear_cache(self) -> None:
+        """
+        Drop every cached LLM response.
+        """
+        self._cache.clear()
+
+    def _cache_lookup(self, user: User, scene_groups: list[list[str]], use_cache: bool):
+        """
+        Look up cached responses for several scene groups.
+        
+        Args:
+            user (User): The user whose bio is sent to the LLM.
+            scene_groups (list[list[str]]): The scene name lists to look up.
+            use_cache (bool): When False, every group is reported as a miss.
+        
+        Returns:
+            tuple: The cache keys, the results with None for each miss, and the indices of the misses.
+        """
+        keys = [self._cache_key(user, scenes) if use_cache else None for scenes in scene_groups]
+        results: list[list[Scene] | None] = [None] * len(scene_groups)
+        pending: list[int] = []
+        for i, key in enumerate(keys):
+            cached = self._cache.get(key) if key is not None else None
+            if cached is not None:
+                results[i] = Scenes.model_validate_json(cached).scenes
+            else:
+                pending.append(i)
+        return keys, results, pending
+
+    def _cache_store(self, keys: list[str | None], results: list[list[Scene] | None],
+                     pending: list[int], outputs: list[Scenes]) -> None:
+        """
+        Cache freshly generated responses and fill them into the missing result slots.
+        
+        Args:
+            keys (list[str | None]): The cache keys from _cache_lookup.
+            results (list[list[Scene] | None]): The results from _cache_lookup, filled in place.
+            pending (list[int]): The indices of the cache misses.
+            outputs (list[Scenes]): The LLM outputs for the misses, in the same order as pending.
+        """
+        for i, output in zip(pending, outputs):
+            if keys[i] is not None:
+                self._cache.set(keys[i], output.model_dump_json())
+            results[i] = output.scenes
+
+    def generate_scenes(self, user: User, scenes: list[str], use_cache: bool = True) -> list[Scene]:
+        """
+        Generate tagged scenes for the given user.
+        
+        Args:
+            user (User): The user to generate scenes for.
+            scenes (list[str]): The names of the scenes that make up the user's day.
+            use_cache (bool): Reuse a previous response for identical input instead of calling the LLM.
+        
+        Returns:
+            list[Scene]: The generated scenes.
+        """
+        keys, results, pending = self._cache_lookup(user, [scenes], use_cache)
+        if pending:
+            outputs = [self._chain.invoke({"bio": user.bio,
+                                           "scenes": scenes})]
+            self._cache_store(keys, results, pending, outputs)
+        return results[0]
+
+    async def agenerate_scenes(self, user: User, scenes: list[str], use_cache: bool = True) -> list[Scene]:
+        """
+        Asynchronous version of generate_scenes, for overlapping LLM calls with asyncio.
+        
+        Args:
+            user (User): The user to generate scenes for.
+            scenes (list[str]): The names of the scenes that make up the user's day.
+            use_cache (bool): Reuse a previous response for identical input instead of calling the LLM.
+        
+        Returns:
+            list[Scene]: The generated scenes.
+        """
+        keys, results, pending = self._cache_lookup(user, [scenes], use_cache)
+        if pending:
+            outputs = [await self._chain.ainvoke({"bio": user.bio,
+                                                  "scenes": scenes})]
+            self._cache_store(keys, results, pending, outputs)
+        return results[0]
 
-    def generate_scenes(self, user: User, scenes: list[str]) -> Scenes:
-        chain = self.get_prompt_template() | self.llm | self.scene_parser
-        format_instruction = self.scene_parser.get_format_instructions()
-        scenes = chain.invoke({"bio": user.bio,
-                               "scenes": scenes,
-                               "format_instruction": format_instruction})
+    def generate_scenes_batch(self, user: User, scene_groups: list[list[str]],
+                              use_cache: bool = True, max_concurrency: int = 16) -> list[list[Scene]]:
+        """
+        Generate tagged scenes for several scene groups with concurrent LLM calls.
         
-        return scenes.scenes
\ No newline at end of file
+        Args:
+            user (User): The user to generate scenes for.
+            scene_groups (list[list[str]]): Independent lists of scene names.
+            use_cache (bool): Reuse previous responses for identical input instead of calling the LLM.
+            max_concurrency (int): The maximum number of LLM requests in flight.
+        
+        Returns:
+            list[list[Scene]]: The generated scenes, in the same order as scene_groups.
+        """
+        keys, results, pending = self._cache_lookup(user, scene_groups, use_cache)
+        if pending:
+            outputs = self._chain.batch([{"bio": user.bio,
+                                          "scenes": scene_groups[i]} for i in pending],
+                                        config={"max_concurrency": max_concurrency})
+            self._cache_store(keys, results, pending, outputs)
+        return results
\ No newline at end of file
@@ -1,9 +1,12 @@
+import sys
+from collections import OrderedDict
 from datetime import datetime
-from pydantic import BaseModel
+from functools import lru_cache
+from hashlib import blake2b
+from pydantic import BaseModel, Field
 from typing import TYPE_CHECKING, Optional
 from langchain_core.prompts import ChatPromptTemplate
 from langchain.schema import BaseOutputParser
-from langchain_openai import ChatOpenAI
 
 if TYPE_CHECKING:
     from .Scene import *
@@ -37,7 +40,7 @@ class User(BaseModel):
     birth_date: datetime
     occupation: str
     personality: list[str]
-    scenes: list['Scene'] = []
+    scenes: list['Scene'] = Field(default_factory=list)
 
     positives: list[str]
     negatives: list[str]
@@ -45,64 +48,148 @@ class User(BaseModel):
 
     status: str = "active"
     is_admin: bool = False
-
     
     @property
     def bio(self):
+        """사용자 정보를 JSON 문자열로 반환합니다.
+        
+        리스트 필드를 직접 수정해도 항상 현재 값을 반영하도록 매번 직렬화합니다.
+        (직렬화 비용은 수십 마이크로초로 LLM 호출에 비해 무시할 수 있습니다.)
+        """
         return self.model_dump_json()
     
-    def generate_prompt(self):
-        prompt_template = ChatPromptTemplate.from_template("""
-        다음은 사용자 정보입니다. 이 정보를 바탕으로, 사용자의 성격과 하루 일과, 주요 관심사를를 상상해서 1문단으로 작성하세요.
-        이를 작성하는 이유는 사용자의 할 일을 사용자의 생활패턴과 맥락에 맞게 구체화하여 추천하기 위해서입니다.
-        사용자에 대한 이해가 깊어질수록 사용자에게 더 유용한 할 일을 추천할 수 있습니다.
-        사용자의 긍정적인 면과 부정적인 면을 모두 포함할 수 있도록 작성하세요.
-
-        작성된 내용 중 사용자가 적합한 것을 선택할 수 있도록, 서로 다른 내용의 답변을 3~5개 생성하세요.
-        각각의 답변은 사용자 정보의 다른 부분에 집중하며, 서로 비슷하지 않은 내용이어야 합니다.
-        예를 들어 한 답변이 "대중교통"이라는 키워드에 집중한다면, 다른 답변은 "도서관" 등 다른 맥락에 집중할 수 있습니다.
-        만약 비슷한 답변이 생성된다면 생략하세요.
-
-        {format_instruction}
-
-        사용자 정보: {bio}
-        """).partial(format_instruction=response_parser.get_format_instructions())
-
-        llm = ChatOpenAI(model_name="gpt-4o-mini", temperature=0.5)
-
-        chain = prompt_template | llm | response_parser
-        responses = chain.invoke({"bio": self.bio})
+    def generate_prompt(self, use_cache: bool = True):
+        """사용자 정보를 바탕으로 프롬프트 후보 목록을 생성합니다.
         
-        return responses
+        use_cache=True(기본값)이면 사용자 정보가 바뀌지 않은 한 이전에 생성한 후보를
+        그대로 반환합니다. 새로운 후보가 필요하면 use_cache=False로 호출하세요.
+        """
+        keys, results, pending = self._prompt_cache_lookup([self], use_cache)
+        if pending:
+            outputs = [_get_prompt_chain().invoke({"bio": self.bio})]
+            self._prompt_cache_store(keys, results, pending, outputs)
+        return results[0]
+    
+    @classmethod
+    def clear_prompt_cache(cls):
+        """generate_prompt 응답 캐시를 모두 비웁니다."""
+        _prompt_cache.clear()
+    
+    @classmethod
+    def _prompt_cache_lookup(cls, users: list['User'], use_cache: bool):
+        keys = [blake2b(user.bio.encode(), digest_size=16).hexdigest() if use_cache else None for user in users]
+        results = [_prompt_cache_get(key) for key in keys]
+        pending = [i for i, result in enumerate(results) if result is None]
+        return keys, results, pending
+    
+    @classmethod
+    def _prompt_cache_store(cls, keys: list, results: list, pending: list[int], outputs: list[list[str]]):
+        # 새로 생성한 응답을 캐시에 저장하고 결과 목록의 빈 자리를 채움
+        for i, output in zip(pending, outputs):
+            _prompt_cache_put(keys[i], output)
+            results[i] = output
+    
+    @classmethod
+    def generate_prompts_batch(cls, users: list['User'], use_cache: bool = True, max_concurrency: int = 16):
+        # 여러 사용자의 프롬프트를 동시에 요청 (캐시에 없는 사용자만 LLM 호출)
+        keys, results, pending = cls._prompt_cache_lookup(users, use_cache)
+        if pending:
+            outputs = _get_prompt_chain().batch([{"bio": users[i].bio} for i in pending],
+                                                config={"max_concurrency": max_concurrency})
+            cls._prompt_cache_store(keys, results, pending, outputs)
+        return results
+    
+    @classmethod
+    async def agenerate_prompts_batch(cls, users: list['User'], use_cache: bool = True, max_concurrency: int = 16):
+        keys, results, pending = cls._prompt_cache_lookup(users, use_cache)
+        if pending:
+            outputs = await _get_prompt_chain().abatch([{"bio": users[i].bio} for i in pending],
+                                                       config={"max_concurrency": max_concurrency})
+            cls._prompt_cache_store(keys, results, pending, outputs)
+        return results
     
     def set_prompt(self, responses: list[str], index: int):
         self.prompt = responses[index]
         
     def append_scenes(self, scenes: list['Scene']):
-        for scene in scenes:
-            self.scenes.append(scene)
+        self.scenes.extend(scenes)
             
-    def print_self(self):
-        print(f"User: {self.name}")
-        print(f"- Location: {self.residence}")
-        print(f"- Birthdate: {self.birth_date}")
-        print(f"- Occupation: {self.occupation}")
-        print(f"- Personality: {self.personality}")
-        print(f"- Positives: {self.positives}")
-        print(f"- Negatives: {self.negatives}")
-        print(f"- Prompt: {self.prompt}")
-        print(f"Daily Scenes of {self.name}:")
+    def _iter_lines(self):
+        yield f"User: {self.name}"
+        yield f"- Location: {self.residence}"
+        yield f"- Birthdate: {self.birth_date}"
+        yield f"- Occupation: {self.occupation}"
+        yield f"- Personality: {self.personality}"
+        yield f"- Positives: {self.positives}"
+        yield f"- Negatives: {self.negatives}"
+        yield f"- Prompt: {self.prompt}"
+        yield f"Daily Scenes of {self.name}:"
         for scene in self.scenes:
-            scene.print_self()
+            yield from scene._summary_lines()
+            
+    def print_self(self):
+        # 줄마다 print하지 않고 한 번에 출력
+        sys.stdout.write("\n".join(self._iter_lines()) + "\n")
 
 class CustomListOutputParser(BaseOutputParser):
     def parse(self, text: str) -> list[str]:
         responses = text.split("---")
-        items = [response.strip() for response in responses]
+        # 앞뒤에 붙은 "---" 때문에 생기는 빈 답변은 제외
+        items = [item for item in (response.strip() for response in responses) if item]
         return items
 
     def get_format_instructions(self) -> str:
         return '서로 다른 답변은 "---"로 구분하세요.'
 
 # 파서 초기화
-response_parser = CustomListOutputParser()
\ No newline at end of file
+response_parser = CustomListOutputParser()
+
+# 사용자 정보 해시 -> generate_prompt 응답 캐시 (최근 사용 순, 최대 _PROMPT_CACHE_MAXSIZE개)
+_PROMPT_CACHE_MAXSIZE = 256
+_prompt_cache: OrderedDict[str, tuple[str, ...]] = OrderedDict()
+
+def _prompt_cache_get(key: Optional[str]) -> Optional[list[str]]:
+    if key is None or key not in _prompt_cache:
+        return None
+    _prompt_cache.move_to_end(key)
+    return list(_prompt_cache[key])
+
+def _prompt_cache_put(key: Optional[str], responses: list[str]) -> None:
+    if key is None:
+        return
+    _prompt_cache[key] = tuple(responses)
+    _prompt_cache.move_to_end(key)
+    if len(_prompt_cache) > _PROMPT_CACHE_MAXSIZE:
+        _prompt_cache.popitem(last=False)
+
+# 고정된 지시문과 형식 지침은 시스템 메시지로 두어 프롬프트 캐시에 재사용
+# (형식 지침은 상수이므로 partial 대신 모듈 로드 시 한 번 문자열에 포함)
+_PROMPT_SYSTEM = f"""
+        다음은 사용자 정보입니다. 이 정보를 바탕으로, 사용자의 성격과 하루 일과, 주요 관심사를를 상상해서 1문단으로 작성하세요.
+        이를 작성하는 이유는 사용자의 할 일을 사용자의 생활패턴과 맥락에 맞게 구체화하여 추천하기 위해서입니다.
+        사용자에 대한 이해가 깊어질수록 사용자에게 더 유용한 할 일을 추천할 수 있습니다.
+        사용자의 긍정적인 면과 부정적인 면을 모두 포함할 수 있도록 작성하세요.
+
+        작성된 내용 중 사용자가 적합한 것을 선택할 수 있도록, 서로 다른 내용의 답변을 3~5개 생성하세요.
+        각각의 답변은 사용자 정보의 다른 부분에 집중하며, 서로 비슷하지 않은 내용이어야 합니다.
+        예를 들어 한 답변이 "대중교통"이라는 키워드에 집중한다면, 다른 답변은 "도서관" 등 다른 맥락에 집중할 수 있습니다.
+        만약 비슷한 답변이 생성된다면 생략하세요.
+
+        {response_parser.get_format_instructions()}
+        """
+
+_PROMPT_USER = "사용자 정보: {bio}"
+
+@lru_cache(maxsize=1)
+def _get_prompt_chain():
+    # 프롬프트 템플릿과 LLM 체인은 처음 사용할 때 한 번만 생성 (OpenAI 클라이언트 초기화도 지연)
+    prompt_template = ChatPromptTemplate.from_messages([
+        ("system", _PROMPT_SYSTEM),
+        ("human", _PROMPT_USER),
+    ])
+
+    # OpenAI 클라이언트 스택은 무거우므로 실제로 필요할 때 import
+    from langchain_openai import ChatOpenAI
+    llm = ChatOpenAI(model_name="gpt-4o-mini", temperature=0.5)
+
+    return prompt_template | llm | response_parser